@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import contextlib
+import copy
+import functools
 import json
 import os
+import pickle
+import re
+import tempfile
+import threading
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Dict, List
+from typing import Dict, Iterator, List, Mapping, Sequence
 from pathlib import Path
 
 from flask import Flask, g, redirect, render_template, request, send_file, url_for
-from fpdf import FPDF
-from fpdf.enums import XPos, YPos
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 app = Flask(__name__)
 app.config["SECRET_KEY"] = "replace-this-with-a-random-value"
@@ -20,15 +30,57 @@ FONT_DIR = BASE_DIR / "fonts"
 PDF_FONT_FAMILY = "NotoSansSC"
 PDF_FONT_REGULAR_PATH = FONT_DIR / "NotoSansSC-Regular.ttf"
 PDF_FONT_BOLD_PATH = FONT_DIR / "NotoSansSC-Bold.ttf"
-try:
-    PERSONA_CONTENT = json.loads(PERSONA_CONTENT_PATH.read_text(encoding="utf-8"))
-except FileNotFoundError:
-    PERSONA_CONTENT = {}
-except json.JSONDecodeError:
-    PERSONA_CONTENT = {}
+# Font files ship with the app, so check for them once instead of per PDF.
+_HAS_PDF_FONT_REGULAR = PDF_FONT_REGULAR_PATH.exists()
+_HAS_PDF_FONT_BOLD = PDF_FONT_BOLD_PATH.exists()
+PERSONA_CONTENT_CACHE_PATH = PERSONA_CONTENT_PATH.with_suffix(".pkl")
+
+
+def load_persona_content() -> Dict[str, object]:
+    """Load persona content, preferring a pickled sidecar built from the current JSON source."""
+    try:
+        source_stat = PERSONA_CONTENT_PATH.stat()
+    except FileNotFoundError:
+        return {}
+    # Deploys can preserve older mtimes, so match the source exactly rather than by age.
+    source_key = (source_stat.st_mtime_ns, source_stat.st_size)
+
+    try:
+        cached_key, cached_content = pickle.loads(PERSONA_CONTENT_CACHE_PATH.read_bytes())
+        if cached_key == source_key:
+            return cached_content
+    except (OSError, pickle.UnpicklingError, EOFError, TypeError, ValueError):
+        pass
+
+    try:
+        if orjson is not None:
+            content = orjson.loads(PERSONA_CONTENT_PATH.read_bytes())
+        else:
+            content = json.loads(PERSONA_CONTENT_PATH.read_text(encoding="utf-8"))
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    # Write beside the sidecar and swap it in so concurrent workers never read a partial file.
+    temp_path = None
+    try:
+        fd, temp_path = tempfile.mkstemp(
+            dir=PERSONA_CONTENT_CACHE_PATH.parent, prefix=".persona_content-", suffix=".pkl"
+        )
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(pickle.dumps((source_key, content), protocol=5))
+        os.replace(temp_path, PERSONA_CONTENT_CACHE_PATH)
+    except OSError:
+        if temp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+    return content
+
 
+PERSONA_CONTENT = load_persona_content()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Question:
     id: int
     dimension: str  # The letter that receives positive scoring before reverse handling
@@ -105,6 +157,10 @@ AXES: Dict[str, Dict[str, str]] = {
 }
 
 AXIS_SEQUENCE: List[str] = ["RQ", "PC", "FE", "AV"]
+_AXES_SEQ = tuple(
+    (axis_key, AXES[axis_key]["positive"], AXES[axis_key]["negative"], AXES[axis_key]["title"])
+    for axis_key in AXIS_SEQUENCE
+)
 
 PERSONA_MAP: Dict[str, Dict[str, Dict[str, str]]] = {
     "RPFA": {"title": {"en": "Algorithm Engineer", "zh": "算法工程师"}},
@@ -124,6 +180,17 @@ PERSONA_MAP: Dict[str, Dict[str, Dict[str, str]]] = {
     "RPEV": {"title": {"en": "Full-Stack Engineer", "zh": "全栈工程师"}},
     "QPEV": {"title": {"en": "Visualization Engineer", "zh": "可视化工程师"}},
 }
+_PERSONA_TITLE_BY_LANG: Dict[str, Dict[str, str | None]] = {
+    language: {
+        code: meta["title"].get(language) or meta["title"].get(DEFAULT_LANGUAGE)
+        for code, meta in PERSONA_MAP.items()
+    }
+    for language in LANGUAGES
+}
+PERSONA_IMAGE_DIR = BASE_DIR / "static" / "images" / "personas"
+_PERSONA_IMAGE_SET = frozenset(
+    code for code in PERSONA_MAP if (PERSONA_IMAGE_DIR / f"{code}.png").exists()
+)
 
 COPY: Dict[str, Dict[str, Dict[str, str] | str]] = {
     "zh": {
@@ -430,6 +497,20 @@ QUESTIONS: List[Question] = [
     ),
 ]
 
+# Per-question scoring metadata laid out as parallel tuples so the scoring loop
+# avoids attribute access and dict lookups.
+_FIELDS = tuple(question.field_name for question in QUESTIONS)
+_AXIS_KEYS = tuple(LETTER_TO_AXIS[question.dimension] for question in QUESTIONS)
+_ORIENTATIONS = tuple(
+    1 if AXES[axis_key]["positive"] == question.dimension else -1
+    for question, axis_key in zip(QUESTIONS, _AXIS_KEYS)
+)
+_SIGNS = tuple(
+    (-1 if question.reverse else 1) * orientation
+    for question, orientation in zip(QUESTIONS, _ORIENTATIONS)
+)
+_AXIS_INDEX = tuple(AXIS_SEQUENCE.index(axis_key) for axis_key in _AXIS_KEYS)
+
 
 def resolve_language(value: str | None) -> str:
     if not value:
@@ -461,21 +542,30 @@ def get_persona_content(profile_code: str, language: str):
     return None
 
 
+@functools.lru_cache(maxsize=512)
+def _language_switch_url(
+    script_root: str, endpoint: str, view_args: tuple, query_args: tuple, code: str
+) -> str:
+    # script_root is only part of the cache key: url_for prefixes it from the current request.
+    try:
+        return url_for(endpoint, **dict(view_args), **dict(query_args))
+    except Exception:
+        return url_for("questionnaire", lang=code)
+
+
 def build_language_switcher(language: str):
     links = []
     endpoint = request.endpoint
-    view_args = request.view_args.copy() if request.view_args else {}
+    view_args = tuple(sorted(request.view_args.items())) if request.view_args else ()
     keep_query = request.method == "GET" and bool(endpoint)
+    base_query = tuple(item for item in request.args.items() if item[0] != "lang") if keep_query else ()
+    # Pages like /results carry per-user answer args that would only churn the cache.
+    switch_url = _language_switch_url.__wrapped__ if base_query else _language_switch_url
     for code, meta in LANGUAGES.items():
         if keep_query:
-            query_args = request.args.to_dict()
-            query_args["lang"] = code
-            try:
-                url = url_for(endpoint, **view_args, **query_args)
-            except Exception:
-                url = url_for("questionnaire", lang=code)
+            url = switch_url(request.script_root, endpoint, view_args, base_query + (("lang", code),), code)
         else:
-            url = url_for("questionnaire", lang=code)
+            url = switch_url(request.script_root, "questionnaire", (), (("lang", code),), code)
         links.append({"code": code, "label": meta["label"], "url": url, "active": code == language})
     return links
 
@@ -495,47 +585,69 @@ def inject_language():
     }
 
 
-def compute_scores(form_data: Dict[str, str]) -> Dict[str, object]:
-    axis_scores = {axis_key: 0.0 for axis_key in AXES.keys()}
-    responses: List[Dict[str, object]] = []
+def parse_answers(form_data: Mapping[str, str]) -> List[int]:
+    """Return raw answers in QUESTIONS order; raises KeyError when one is missing."""
+    return [int(form_data[field]) for field in _FIELDS]
+
 
-    for question in QUESTIONS:
-        raw_value = int(form_data[question.field_name])
+def compute_axis_scores(answers: Sequence[int]) -> Dict[str, float]:
+    axis_scores = {axis_key: 0.0 for axis_key in AXES.keys()}
+    for axis_key, sign, raw_value in zip(_AXIS_KEYS, _SIGNS, answers):
+        axis_scores[axis_key] += sign * raw_value
+    return axis_scores
+
+
+def compute_axis_scores_batch(answer_rows: Sequence[Sequence[int]]) -> List[Dict[str, float]]:
+    """Score many answer sets at once; each row lists raw answers in QUESTIONS order."""
+    if not answer_rows:
+        return []
+    import numpy as np
+
+    # int64 like compute_axis_scores' Python ints, so out-of-range answers never wrap.
+    answers = np.asarray(answer_rows, dtype=np.int64)
+    if answers.ndim != 2 or answers.shape[1] != len(QUESTIONS):
+        raise ValueError(f"expected rows of {len(QUESTIONS)} answers, got shape {answers.shape}")
+    contributions = answers * np.asarray(_SIGNS, dtype=np.int64)
+    axis_matrix = np.zeros((len(QUESTIONS), len(AXIS_SEQUENCE)), dtype=np.int64)
+    axis_matrix[np.arange(len(QUESTIONS)), _AXIS_INDEX] = 1
+    totals = contributions @ axis_matrix
+    return [
+        {axis_key: float(total) for axis_key, total in zip(AXIS_SEQUENCE, row)}
+        for row in totals.tolist()
+    ]
+
+
+def iter_responses(answers: Sequence[int]) -> Iterator[Dict[str, object]]:
+    for question, axis_key, orientation, raw_value in zip(
+        QUESTIONS, _AXIS_KEYS, _ORIENTATIONS, answers
+    ):
         adjusted_value = -raw_value if question.reverse else raw_value
-        axis_key = LETTER_TO_AXIS[question.dimension]
-        axis_info = AXES[axis_key]
-        orientation = 1 if axis_info["positive"] == question.dimension else -1
-        weighted_value = orientation * adjusted_value
-        axis_scores[axis_key] += weighted_value
+        yield {
+            "question": question,
+            "raw": raw_value,
+            "adjusted": adjusted_value,
+            "axis": axis_key,
+            "orientation": orientation,
+            "weighted": orientation * adjusted_value,
+        }
 
-        responses.append(
-            {
-                "question": question,
-                "raw": raw_value,
-                "adjusted": adjusted_value,
-                "axis": axis_key,
-                "orientation": orientation,
-                "weighted": weighted_value,
-            }
-        )
 
-    return {"axis_scores": axis_scores, "responses": responses}
+def compute_scores(form_data: Dict[str, str]) -> Dict[str, object]:
+    answers = parse_answers(form_data)
+    return {"axis_scores": compute_axis_scores(answers), "responses": list(iter_responses(answers))}
 
 
 def build_profile_code(axis_scores: Dict[str, float], letter_descriptions: Dict[str, str]):
     breakdown = []
     code_letters: List[str] = []
 
-    for axis_key in AXIS_SEQUENCE:
-        info = AXES[axis_key]
-        positive_letter = info["positive"]
-        negative_letter = info["negative"]
+    for axis_key, positive_letter, negative_letter, title in _AXES_SEQ:
         score = axis_scores.get(axis_key, 0.0)
         selected = positive_letter if score >= 0 else negative_letter
         breakdown.append(
             {
                 "axis_key": axis_key,
-                "title": info["title"],
+                "title": title,
                 "score": score,
                 "selected": selected,
                 "magnitude": abs(score),
@@ -549,8 +661,8 @@ def build_profile_code(axis_scores: Dict[str, float], letter_descriptions: Dict[
     return "".join(code_letters), breakdown
 
 
-def sanitize_for_pdf(text: str) -> str:
-    replacements = {
+_PDF_CHAR_TABLE = str.maketrans(
+    {
         "’": "'",
         "‘": "'",
         "“": '"',
@@ -558,40 +670,117 @@ def sanitize_for_pdf(text: str) -> str:
         "–": "-",
         "—": "-",
         "…": "...",
-        "💡": "[Idea] ",
-        "🏢": "[Industry] ",
-        "🌍": "[Trend] ",
-        "⚙️": "[Challenge] ",
-        "🚀": "[Opportunity] ",
-        "📈": "[Growth] ",
-        "🌱": "[Development] ",
-        "✅": "[Tagline] ",
-        "🧮": "[Analytics] ",
-        "🏗️": "[Backend] ",
-        "💻": "[Frontend] ",
-        "🎮": "[Game] ",
-        "🖥️": "[Tech] ",
-        "🧭": "[Architect] ",
-        "🧑‍💻": "[Engineer] ",
-        "🧪": "[Innovation] ",
-        "⛏️": "[Miner] ",
-        "🎯": "[Target] ",
-        "📊": "[Data] ",
-        "🚦": "[Ops] ",
-        "🧠": "[Mindset] ",
-        "🤖": "[AI] ",
-        "🔁": "[Reverse] ",
-        "🌐": "[Global] ",
-        "🔧": "[Tool] ",
-        "📌": "[Point] ",
-        "🔗": "[Link] ",
-        "️": "",
-        "⃣": "",
         "™": "TM",
     }
-    for src, dest in replacements.items():
-        text = text.replace(src, dest)
-    return text
+)
+_PDF_MULTI_REPLACEMENTS: Dict[str, str] = {
+    "💡": "[Idea] ",
+    "🏢": "[Industry] ",
+    "🌍": "[Trend] ",
+    "⚙️": "[Challenge] ",
+    "🚀": "[Opportunity] ",
+    "📈": "[Growth] ",
+    "🌱": "[Development] ",
+    "✅": "[Tagline] ",
+    "🧮": "[Analytics] ",
+    "🏗️": "[Backend] ",
+    "💻": "[Frontend] ",
+    "🎮": "[Game] ",
+    "🖥️": "[Tech] ",
+    "🧭": "[Architect] ",
+    "🧑‍💻": "[Engineer] ",
+    "🧪": "[Innovation] ",
+    "⛏️": "[Miner] ",
+    "🎯": "[Target] ",
+    "📊": "[Data] ",
+    "🚦": "[Ops] ",
+    "🧠": "[Mindset] ",
+    "🤖": "[AI] ",
+    "🔁": "[Reverse] ",
+    "🌐": "[Global] ",
+    "🔧": "[Tool] ",
+    "📌": "[Point] ",
+    "🔗": "[Link] ",
+    "️": "",
+    "⃣": "",
+}
+_PDF_MULTI_PATTERN = re.compile(
+    "|".join(re.escape(src) for src in sorted(_PDF_MULTI_REPLACEMENTS, key=len, reverse=True))
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def sanitize_for_pdf(text: str) -> str:
+    text = text.translate(_PDF_CHAR_TABLE)
+    return _PDF_MULTI_PATTERN.sub(lambda match: _PDF_MULTI_REPLACEMENTS[match.group(0)], text)
+
+
+_PDF_TEXT_SANITIZED: Dict[str, Dict[str, str]] = {
+    language: {key: sanitize_for_pdf(value) for key, value in COPY[language]["pdf"].items()}  # type: ignore[union-attr]
+    for language in LANGUAGES
+}
+
+
+_pdf_font_lock = threading.Lock()
+_pdf_font_prototype = None
+_PDF_FONT_KEYS = tuple(
+    key
+    for key, available in (
+        (PDF_FONT_FAMILY.lower(), _HAS_PDF_FONT_REGULAR),
+        (f"{PDF_FONT_FAMILY.lower()}B", _HAS_PDF_FONT_BOLD),
+    )
+    if available
+)
+
+
+def _add_pdf_fonts(pdf) -> None:
+    if _HAS_PDF_FONT_REGULAR:
+        pdf.add_font(PDF_FONT_FAMILY, "", str(PDF_FONT_REGULAR_PATH))
+    if _HAS_PDF_FONT_BOLD:
+        pdf.add_font(PDF_FONT_FAMILY, "B", str(PDF_FONT_BOLD_PATH))
+
+
+def _pdf_fonts_copyable(pdf) -> bool:
+    """Check the fpdf2 internals that copying registered fonts between documents relies on."""
+    fonts = getattr(pdf, "fonts", None)
+    if not isinstance(fonts, dict) or not all(key in fonts for key in _PDF_FONT_KEYS):
+        return False
+    return all(
+        hasattr(fonts[key], "ttffile")
+        and hasattr(fonts[key], "ttfont")
+        and "__deepcopy__" in type(fonts[key]).__dict__
+        for key in _PDF_FONT_KEYS
+    )
+
+
+def _get_pdf_fonts() -> Dict[str, object] | None:
+    """Return fresh copies of the CJK fonts, parsing the TTF files only once per process.
+
+    Returns None when this fpdf2 build lacks the internals the copy relies on;
+    callers then register the fonts on each document with ``add_font``.
+    """
+    global _pdf_font_prototype
+    if not _PDF_FONT_KEYS:
+        return {}
+    with _pdf_font_lock:
+        if _pdf_font_prototype is None:
+            from fpdf import FPDF
+
+            prototype = FPDF()
+            _add_pdf_fonts(prototype)
+            _pdf_font_prototype = prototype if _pdf_fonts_copyable(prototype) else False
+        if not _pdf_font_prototype:
+            return None
+        fonts = copy.deepcopy(_pdf_font_prototype.fonts)
+
+    # fpdf2 2.8 deepcopies TTFFont cheaply by sharing the fontTools object,
+    # but output() subsets it in place; give each document its own lazily
+    # loaded handle on the TTF file.
+    from fontTools import ttLib
+
+    for font in fonts.values():
+        font.ttfont = ttLib.TTFont(font.ttffile, recalcTimestamp=False, lazy=True)
+    return fonts
 
 
 def generate_pdf_report(
@@ -604,6 +793,9 @@ def generate_pdf_report(
     persona_tagline: str | None = None,
     persona_tagline_heading: str | None = None,
 ) -> BytesIO:
+    from fpdf import FPDF
+    from fpdf.enums import XPos, YPos
+
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
@@ -617,36 +809,36 @@ def generate_pdf_report(
     bold_family = "Helvetica"
     bold_style = "B"
     try:
-        if PDF_FONT_REGULAR_PATH.exists():
-            pdf.add_font(PDF_FONT_FAMILY, "", str(PDF_FONT_REGULAR_PATH), uni=True)
-            regular_family = PDF_FONT_FAMILY
-            bold_family = PDF_FONT_FAMILY
-            regular_style = ""
-            bold_style = ""
-        if PDF_FONT_BOLD_PATH.exists():
-            pdf.add_font(PDF_FONT_FAMILY, "B", str(PDF_FONT_BOLD_PATH), uni=True)
-            bold_style = "B"
+        fonts = _get_pdf_fonts()
+        if fonts is None:
+            _add_pdf_fonts(pdf)
+        else:
+            pdf.fonts.update(fonts)
+        has_regular_font, has_bold_font = _HAS_PDF_FONT_REGULAR, _HAS_PDF_FONT_BOLD
     except RuntimeError:
-        regular_family = "Helvetica"
-        regular_style = ""
-        bold_family = "Helvetica"
+        has_regular_font = has_bold_font = False
+    if has_regular_font:
+        regular_family = PDF_FONT_FAMILY
+        bold_family = PDF_FONT_FAMILY
+        bold_style = ""
+    if has_bold_font:
         bold_style = "B"
 
-    pdf_text = get_copy(language)["pdf"]  # type: ignore[assignment]
-    pdf.set_title(pdf_text["title"])  # type: ignore[index]
+    pdf_text = _PDF_TEXT_SANITIZED.get(language, _PDF_TEXT_SANITIZED[DEFAULT_LANGUAGE])
+    pdf.set_title(pdf_text["title"])
     pdf.set_author("DevSpectrum")
 
     pdf.set_text_color(*base_text_color)
 
     pdf.set_font(bold_family, bold_style, 16)
-    pdf.cell(0, 10, sanitize_for_pdf(pdf_text["title"]))  # type: ignore[index]
+    pdf.cell(0, 10, pdf_text["title"])
     pdf.ln(8)
 
     pdf.set_font(regular_family, regular_style, 12)
-    pdf.cell(0, 8, sanitize_for_pdf(f"{pdf_text['profile_code']}: {profile_code}"))  # type: ignore[index]
+    pdf.cell(0, 8, sanitize_for_pdf(f"{pdf_text['profile_code']}: {profile_code}"))
     pdf.ln(6)
     if persona_title:
-        pdf.cell(0, 8, sanitize_for_pdf(f"{pdf_text['persona']}: {persona_title}"))  # type: ignore[index]
+        pdf.cell(0, 8, sanitize_for_pdf(f"{pdf_text['persona']}: {persona_title}"))
         pdf.ln(6)
 
     if persona_tagline:
@@ -661,12 +853,12 @@ def generate_pdf_report(
 
     if persona_sections:
         pdf.set_font(bold_family, bold_style, 13)
-        section_title = pdf_text.get("persona_sections") or pdf_text.get("persona")  # type: ignore[index]
+        section_title = pdf_text.get("persona_sections") or pdf_text.get("persona")
         pdf.set_fill_color(244, 245, 251)
         pdf.cell(
             0,
             10,
-            sanitize_for_pdf(section_title),
+            section_title,
             fill=True,
             new_x=XPos.LMARGIN,
             new_y=YPos.NEXT,
@@ -707,36 +899,37 @@ def generate_pdf_report(
 
     pdf.ln(4)
     pdf.set_font(bold_family, bold_style, 14)
-    pdf.cell(0, 8, sanitize_for_pdf(pdf_text["axis_breakdown"]))  # type: ignore[index]
+    pdf.cell(0, 8, pdf_text["axis_breakdown"])
     pdf.ln(6)
 
     pdf.set_font(regular_family, regular_style, 12)
-    for axis in breakdown:
-        axis_text = sanitize_for_pdf(
-            f"{axis['title']}: {axis['score']:.1f} (favours {axis['selected_label']})"
-        )
-        pdf.multi_cell(0, 6, axis_text, align="L")
-        pdf.ln(1)
+    axis_text = "\n".join(
+        sanitize_for_pdf(f"{axis['title']}: {axis['score']:.1f} (favours {axis['selected_label']})")
+        for axis in breakdown
+    )
+    pdf.multi_cell(0, 6, axis_text, align="L")
+    pdf.ln(1)
 
     pdf.ln(3)
     pdf.set_font(bold_family, bold_style, 14)
-    pdf.cell(0, 8, sanitize_for_pdf(pdf_text["answer_summary"]))  # type: ignore[index]
+    pdf.cell(0, 8, pdf_text["answer_summary"])
     pdf.ln(6)
 
     pdf.set_font(regular_family, regular_style, 11)
+    # The template is already sanitized and the inserted values are plain numbers.
+    answer_line_template = pdf_text["answer_line"]
+    answer_blocks = []
     for item in responses:
         question = item["question"]
         prompt = question.prompt_cn if language == "zh" else question.prompt_en
-        pdf.multi_cell(0, 6, sanitize_for_pdf(f"Q{question.id}: {prompt}"), align="L")
-        answer_line = sanitize_for_pdf(
-            pdf_text["answer_line"].format(  # type: ignore[index]
-                raw=item["raw"],
-                adjusted=item["adjusted"],
-                weighted=f"{item['weighted']:.1f}",
-            )
+        answer_line = answer_line_template.format(
+            raw=item["raw"],
+            adjusted=item["adjusted"],
+            weighted=f"{item['weighted']:.1f}",
         )
-        pdf.cell(0, 5, answer_line)
-        pdf.ln(6)
+        answer_blocks.append(f"{sanitize_for_pdf(f'Q{question.id}: {prompt}')}\n{answer_line}")
+    pdf.multi_cell(0, 6, "\n\n".join(answer_blocks), align="L")
+    pdf.ln(6)
 
     buffer = BytesIO()
     pdf.output(buffer)
@@ -744,10 +937,22 @@ def generate_pdf_report(
     return buffer
 
 
+@functools.lru_cache(maxsize=8)
+def _render_quiz(language: str, script_root: str) -> str:
+    # script_root is only part of the cache key: url_for prefixes it from the current request.
+    return render_template(
+        "quiz.html",
+        questions=QUESTIONS,
+        options=LIKERT_OPTIONS,
+        error=None,
+        submitted={},
+        letter_descriptions=get_letter_descriptions(language),
+    )
+
+
 @app.route("/", methods=["GET", "POST"])
 def questionnaire():
     language = getattr(g, "language", DEFAULT_LANGUAGE)
-    letter_descriptions = get_letter_descriptions(language)
 
     if request.method == "POST":
         missing = [
@@ -765,7 +970,7 @@ def questionnaire():
                 options=LIKERT_OPTIONS,
                 error=error_message,
                 submitted={field: request.form.get(field) for field in request.form},
-                letter_descriptions=letter_descriptions,
+                letter_descriptions=get_letter_descriptions(language),
             )
 
         answer_fields = {
@@ -775,14 +980,11 @@ def questionnaire():
         query_params.update(answer_fields)
         return redirect(url_for("results", **query_params))
 
-    return render_template(
-        "quiz.html",
-        questions=QUESTIONS,
-        options=LIKERT_OPTIONS,
-        error=None,
-        submitted={},
-        letter_descriptions=letter_descriptions,
-    )
+    # Extra query args end up in the language switcher links, so only the plain
+    # page is cached; debug mode skips the cache so template edits show up.
+    if not app.debug and request.args.keys() <= {"lang"}:
+        return _render_quiz(language, request.script_root)
+    return _render_quiz.__wrapped__(language, request.script_root)
 
 
 @app.get("/results")
@@ -790,36 +992,29 @@ def results():
     language = getattr(g, "language", DEFAULT_LANGUAGE)
     letter_descriptions = get_letter_descriptions(language)
 
-    answer_fields: Dict[str, str] = {}
-    for question in QUESTIONS:
-        value = request.args.get(question.field_name)
-        if value is None:
-            return redirect(url_for("questionnaire", lang=language))
-        answer_fields[question.field_name] = value
-
-    score_data = compute_scores(answer_fields)
-    profile_code, breakdown = build_profile_code(score_data["axis_scores"], letter_descriptions)
+    try:
+        answers = parse_answers(request.args)
+    except KeyError:
+        return redirect(url_for("questionnaire", lang=language))
+    axis_scores = compute_axis_scores(answers)
+    profile_code, breakdown = build_profile_code(axis_scores, letter_descriptions)
 
-    persona_meta = PERSONA_MAP.get(profile_code)
-    persona_title = None
-    if persona_meta:
-        persona_title = persona_meta["title"].get(language) or persona_meta["title"].get(DEFAULT_LANGUAGE)
+    persona_title = _PERSONA_TITLE_BY_LANG[language].get(profile_code)
 
     persona_content = get_persona_content(profile_code, language)
     persona_sections = persona_content["sections"] if persona_content else []
     persona_tagline = persona_content.get("tagline") if persona_content else None
     persona_tagline_heading = persona_content.get("tagline_heading") if persona_content else None
 
-    image_path = f"static/images/personas/{profile_code}.png"
-    image_url = image_path if os.path.exists(image_path) else None
+    image_url = f"static/images/personas/{profile_code}.png" if profile_code in _PERSONA_IMAGE_SET else None
 
     return render_template(
         "result.html",
         profile_code=profile_code,
         persona_title=persona_title,
         breakdown=breakdown,
-        axis_scores=score_data["axis_scores"],
-        responses=score_data["responses"],
+        axis_scores=axis_scores,
+        responses=list(iter_responses(answers)),
         letter_descriptions=letter_descriptions,
         image_url=image_url,
         persona_sections=persona_sections,
@@ -830,23 +1025,18 @@ def results():
 
 @app.post("/export/pdf")
 def export_pdf():
-    form_values = request.form.to_dict()
-    language = resolve_language(form_values.get("lang"))
-    answer_fields = {
-        field: value for field, value in form_values.items() if field.startswith("q")
-    }
-
-    if len(answer_fields) != len(QUESTIONS):
+    form = request.form
+    language = resolve_language(form.get("lang"))
+    try:
+        answers = parse_answers(form)
+    except KeyError:
         error_text = get_copy(language)["errors"]["incomplete_pdf"]  # type: ignore[index]
         return (error_text, 400)
 
-    score_data = compute_scores(answer_fields)
+    axis_scores = compute_axis_scores(answers)
     letter_descriptions = get_letter_descriptions(language)
-    profile_code, breakdown = build_profile_code(score_data["axis_scores"], letter_descriptions)
-    persona_meta = PERSONA_MAP.get(profile_code)
-    persona_title = None
-    if persona_meta:
-        persona_title = persona_meta["title"].get(language) or persona_meta["title"].get(DEFAULT_LANGUAGE)
+    profile_code, breakdown = build_profile_code(axis_scores, letter_descriptions)
+    persona_title = _PERSONA_TITLE_BY_LANG[language].get(profile_code)
 
     persona_content = get_persona_content(profile_code, language)
     persona_sections = persona_content["sections"] if persona_content else []
@@ -857,7 +1047,7 @@ def export_pdf():
         profile_code=profile_code,
         persona_title=persona_title,
         breakdown=breakdown,
-        responses=score_data["responses"],
+        responses=iter_responses(answers),
         language=language,
         persona_sections=persona_sections,
         persona_tagline=persona_tagline,
@@ -3,17 +3,26 @@
 Selenium end-to-end test runner for the DevSpectrum questionnaire.
 
 Run this script while the Flask app is serving the quiz (default http://127.0.0.1:5001/).
-It drives a visible Chrome browser by default so you can watch multiple persona
-combinations being answered and see the resulting profile pages.
+When launched from a terminal it drives a visible Chrome browser so you can watch
+multiple persona combinations being answered and see the resulting profile pages;
+non-interactive runs (CI, piped output) default to headless Chrome.
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import logging
+import logging.handlers
+import os
+import queue
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 # Ensure project root is importable when executed via `python tests/...`
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -27,7 +36,7 @@ from app import (  # type: ignore # noqa: E402
     LETTER_TO_AXIS,
     QUESTIONS,
     build_profile_code,
-    compute_scores,
+    compute_axis_scores_batch,
 )
 
 from selenium import webdriver  # noqa: E402
@@ -36,19 +45,83 @@ from selenium.webdriver.chrome.service import Service  # noqa: E402
 from selenium.webdriver.common.by import By  # noqa: E402
 from selenium.webdriver.support import expected_conditions as EC  # noqa: E402
 from selenium.webdriver.support.ui import WebDriverWait  # noqa: E402
-from webdriver_manager.chrome import ChromeDriverManager  # noqa: E402
 
 BASE_URL_DEFAULT = "http://127.0.0.1:5001/"
 DEFAULT_PROFILE_CODES = ["RPFA", "QCEV", "RPEV", "QPFV"]
+# Per-user default so users on a shared host don't trip over each other's profile;
+# concurrent runs by the same user should pass distinct --profile-dir values.
+# (Windows temp dirs are already per user.)
+_PROFILE_OWNER = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+CHROME_PROFILE_DIR = Path(
+    os.environ.get("DEVSPECTRUM_CHROME_PROFILE")
+    or Path(tempfile.gettempdir()) / f"devspectrum-selenium{_PROFILE_OWNER}"
+)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records as-is so the listener thread, not the worker, formats them."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue never leaves this process, so the record needs no flattening.
+        return record
+
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log = logging.getLogger("selenium_quiz")
+log.addHandler(_DeferredQueueHandler(_log_queue))
+log.setLevel(logging.INFO)
+log.propagate = False
+
+_driver_path: str | None = os.environ.get("CHROMEDRIVER") or None
+_browser_path: str | None = None
+DEMO_SCROLL_EVERY = 5
+RADIO_INDEX_SCRIPT = """
+return Array.from(document.querySelectorAll("form.panel-form input[type='radio']"))
+  .map((input) => [input.name, input.value, input]);
+"""
+FILL_ANSWERS_SCRIPT = """
+const plan = arguments[0];
+for (const [name, value] of Object.entries(plan)) {
+  const input = document.querySelector(`input[name='${name}'][value='${value}']`);
+  input.checked = true;
+  input.dispatchEvent(new Event("change", {bubbles: true}));
+}
+"""
 
 
-def build_driver(headless: bool) -> webdriver.Chrome:
+def build_driver(headless: bool, profile_dir: Path = CHROME_PROFILE_DIR) -> webdriver.Chrome:
     options = Options()
     options.add_argument("--window-size=1280,900")
+    # A persistent profile keeps Chrome's HTTP cache warm across profile runs and script invocations.
+    options.add_argument(f"--user-data-dir={profile_dir}")
+    options.add_argument(f"--disk-cache-dir={profile_dir / 'cache'}")
     if headless:
+        # Nobody sees the pages, so skip image decoding and GPU work; the
+        # sandbox and /dev/shm flags keep Chrome stable in CI containers.
         options.add_argument("--headless=new")
-    service = Service(ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options)
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--no-sandbox")
+        options.add_experimental_option(
+            "prefs",
+            {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            },
+        )
+    # Selenium Manager resolves and caches a matching chromedriver (under
+    # ~/.cache/selenium); CHROMEDRIVER pins an explicit binary instead. Either
+    # way the path is resolved once and reused for every pooled driver.
+    global _driver_path, _browser_path
+    if _browser_path:
+        options.binary_location = _browser_path
+    service = Service(_driver_path) if _driver_path else None
+    driver = webdriver.Chrome(service=service, options=options)
+    if not _driver_path:
+        _driver_path = driver.service.path
+        _browser_path = options.binary_location
+    return driver
 
 
 def determine_axis_targets(profile_code: str) -> Dict[str, str]:
@@ -64,35 +137,41 @@ def determine_axis_targets(profile_code: str) -> Dict[str, str]:
     return targets
 
 
-def raw_answer_for_question(question, axis_targets: Dict[str, str]) -> int:
-    axis_key = LETTER_TO_AXIS[question.dimension]
-    target = axis_targets[axis_key]
-    axis_info = AXES[axis_key]
-
-    orientation = 1 if axis_info["positive"] == question.dimension else -1
-    reverse = question.reverse
-
-    if target == "positive":
-        if orientation == 1:
-            return 3 if not reverse else -3
-        return -3 if not reverse else 3
-
-    # target == "negative"
-    if orientation == 1:
-        return -3 if not reverse else 3
-    return 3 if not reverse else -3
+# (axis target, orientation, reverse) -> the extreme answer that pushes the axis toward the target.
+_ANSWER: Dict[Tuple[str, int, bool], int] = {
+    (target, orientation, reverse): 3 * (1 if target == "positive" else -1) * orientation * (-1 if reverse else 1)
+    for target in ("positive", "negative")
+    for orientation in (1, -1)
+    for reverse in (False, True)
+}
+_Q_META = [
+    (
+        question.id,
+        LETTER_TO_AXIS[question.dimension],
+        1 if AXES[LETTER_TO_AXIS[question.dimension]]["positive"] == question.dimension else -1,
+        question.reverse,
+    )
+    for question in QUESTIONS
+]
 
 
+@functools.lru_cache(maxsize=None)
 def build_answer_plan(profile_code: str) -> Dict[int, int]:
-    axis_targets = determine_axis_targets(profile_code)
-    return {question.id: raw_answer_for_question(question, axis_targets) for question in QUESTIONS}
+    targets = determine_axis_targets(profile_code)
+    return {
+        question_id: _ANSWER[(targets[axis_key], orientation, reverse)]
+        for question_id, axis_key, orientation, reverse in _Q_META
+    }
 
 
-def expected_profile_code(answer_plan: Dict[int, int]) -> str:
-    form_data = {f"q{question_id}": str(value) for question_id, value in answer_plan.items()}
-    score_data = compute_scores(form_data)
-    profile_code, _ = build_profile_code(score_data["axis_scores"], LETTER_DESCRIPTIONS["en"])
-    return profile_code
+def expected_profile_codes(answer_plans: Dict[str, Dict[int, int]]) -> Dict[str, str]:
+    """Score every answer plan in one vectorized batch, keyed like ``answer_plans``."""
+    rows = [[plan[question.id] for question in QUESTIONS] for plan in answer_plans.values()]
+    letter_descriptions = LETTER_DESCRIPTIONS["en"]
+    return {
+        code: build_profile_code(axis_scores, letter_descriptions)[0]
+        for code, axis_scores in zip(answer_plans, compute_axis_scores_batch(rows))
+    }
 
 
 def fill_questionnaire(
@@ -100,17 +179,74 @@ def fill_questionnaire(
     wait: WebDriverWait,
     answer_plan: Dict[int, int],
     answer_delay: float,
+    headless: bool = False,
 ) -> None:
+    # The quiz markup is static, so once the form exists every radio input is present.
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "form.panel-form")))
-
-    for question in QUESTIONS:
-        value_str = str(answer_plan[question.id])
-        locator = (By.CSS_SELECTOR, f"input[name='{question.field_name}'][value='{value_str}']")
-        option = wait.until(EC.element_to_be_clickable(locator))
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", option)
+    pause = answer_delay if not headless else 0.0
+
+    if pause <= 0:
+        # Nobody is watching: tick every answer in one script call instead of
+        # paying several WebDriver round-trips per question.
+        field_to_value = {
+            question.field_name: str(answer_plan[question.id]) for question in QUESTIONS
+        }
+        driver.execute_script(FILL_ANSWERS_SCRIPT, field_to_value)
+        return
+
+    # Scroll once to the form; click() brings off-screen inputs into view itself,
+    # so re-centre only every few questions to keep the walkthrough easy to follow.
+    driver.execute_script("document.querySelector('form.panel-form').scrollIntoView({block: 'start'});")
+    # One round-trip for every radio with its name/value, rather than calling
+    # get_attribute twice per element or looking each answer up separately.
+    radios = {
+        (name, value): element
+        for name, value, element in driver.execute_script(RADIO_INDEX_SCRIPT)
+    }
+    for index, question in enumerate(QUESTIONS):
+        option = radios[(question.field_name, str(answer_plan[question.id]))]
+        if index and index % DEMO_SCROLL_EVERY == 0:
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", option)
         option.click()
-        if answer_delay > 0:
-            time.sleep(answer_delay)
+        time.sleep(pause)
+
+
+class DriverPool:
+    """Pre-spawned Chrome drivers, each with its own profile directory, shared by worker threads."""
+
+    def __init__(self, size: int, headless: bool, profile_dir: Path = CHROME_PROFILE_DIR) -> None:
+        self.size = size
+        self.headless = headless
+        self.profile_dir = profile_dir
+        self._drivers: List[webdriver.Chrome] = []
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+
+    def __enter__(self) -> "DriverPool":
+        try:
+            for worker in range(self.size):
+                driver = build_driver(self.headless, profile_dir=self.profile_dir / f"worker-{worker}")
+                self._drivers.append(driver)
+                self._idle.put(driver)
+        except BaseException:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for driver in self._drivers:
+            driver.quit()
+        self._drivers.clear()
+
+    @contextmanager
+    def checkout(self) -> Iterator[webdriver.Chrome]:
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
 
 
 def run_profiles(
@@ -119,35 +255,51 @@ def run_profiles(
     pause_seconds: float,
     answer_delay: float,
     headless: bool,
+    profile_dir: Path = CHROME_PROFILE_DIR,
 ) -> None:
-    driver = build_driver(headless=headless)
-    wait = WebDriverWait(driver, 20)
     normalized_url = base_url.rstrip("/") + "/"
-
-    try:
-        codes = list(profile_codes)
-        total = len(codes)
-        for index, profile_code in enumerate(codes, start=1):
-            answer_plan = build_answer_plan(profile_code)
-            expected_code = expected_profile_code(answer_plan)
-
+    codes = list(profile_codes)
+    total = len(codes)
+    if not total:
+        return
+    # A visible run is a walkthrough to watch, so keep it to one browser window.
+    pool_size = min(total, os.cpu_count() or 1) if headless else 1
+
+    # Keep pure-Python scoring out of the browser-bound section.
+    plans = {code: build_answer_plan(code) for code in set(codes)}
+    expected = expected_profile_codes(plans)
+
+    def run_one(pool: DriverPool, index: int, profile_code: str) -> None:
+        answer_plan = plans[profile_code]
+        expected_code = expected[profile_code]
+
+        with pool.checkout() as driver:
+            wait = WebDriverWait(driver, 20, poll_frequency=0.05)
             driver.get(normalized_url)
-            fill_questionnaire(driver, wait, answer_plan, answer_delay)
+            fill_questionnaire(driver, wait, answer_plan, answer_delay, headless=headless)
 
-            submit = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button[type='submit']")))
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit)
-            submit.click()
+            # The quiz has no submit handlers, so submitting the form directly is equivalent.
+            driver.execute_script("document.querySelector('form.panel-form').submit();")
 
             result = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, ".result-code")))
             actual_code = result.text.strip().upper()
-            print(f"[{index}/{total}] Target {profile_code} -> page shows {actual_code}")
+            log.info("[%d/%d] Target %s -> page shows %s", index, total, profile_code, actual_code)
             if actual_code != expected_code:
-                print(f"    (!) Expected {expected_code} based on predefined answers.")
+                log.warning(
+                    "    (!) Expected %s for %s based on predefined answers.", expected_code, profile_code
+                )
 
             if not headless and pause_seconds > 0:
                 time.sleep(pause_seconds)
+
+    # Workers only enqueue log records; the listener thread formats and writes them.
+    listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    try:
+        with DriverPool(pool_size, headless, profile_dir) as pool, ThreadPoolExecutor(max_workers=pool_size) as executor:
+            list(executor.map(functools.partial(run_one, pool), range(1, total + 1), codes))
     finally:
-        driver.quit()
+        listener.stop()
 
 
 def parse_args() -> argparse.Namespace:
@@ -177,12 +329,29 @@ def parse_args() -> argparse.Namespace:
         "--answer-delay",
         type=float,
         default=0.25,
-        help="Delay (seconds) between selecting answers so the interaction is easier to follow.",
+        help=(
+            "Delay (seconds) between selecting answers so the interaction is easier to follow. "
+            "Ignored in headless mode."
+        ),
     )
     parser.add_argument(
         "--headless",
-        action="store_true",
-        help="Run Chrome in headless mode (no visible window).",
+        action=argparse.BooleanOptionalAction,
+        default=not sys.stdout.isatty(),
+        help=(
+            "Run Chrome in headless mode (no visible window). "
+            "Defaults to headless when output is not a terminal, e.g. in CI."
+        ),
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=CHROME_PROFILE_DIR,
+        help=(
+            "Chrome profile directory, reused between runs to keep the HTTP cache warm "
+            "(default: %(default)s, or $DEVSPECTRUM_CHROME_PROFILE). "
+            "Give concurrent runs distinct directories; Chrome locks a profile while it is open."
+        ),
     )
     return parser.parse_args()
 
@@ -201,6 +370,7 @@ def main() -> None:
             pause_seconds=args.pause_seconds,
             answer_delay=args.answer_delay,
             headless=args.headless,
+            profile_dir=args.profile_dir,
         )
     except Exception as exc:  # pragma: no cover - best-effort logging
         print(f"Selenium run failed: {exc}", file=sys.stderr)
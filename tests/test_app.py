@@ -1,23 +1,61 @@
+import re
+
 import pytest
 
-from app import QUESTIONS, app
+from app import (
+    QUESTIONS,
+    _get_pdf_fonts,
+    app,
+    compute_axis_scores,
+    compute_axis_scores_batch,
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
     app.config.update(TESTING=True)
     with app.test_client() as client:
         yield client
 
 
-def _baseline_answers():
-    return {question.field_name: "1" for question in QUESTIONS}
+_BASELINE_ANSWERS = {question.field_name: "1" for question in QUESTIONS}
+
+
+def _baseline_answers_with(lang="en"):
+    return {**_BASELINE_ANSWERS, "lang": lang}
+
+
+def _submit_quiz(client, lang, payload):
+    response = client.post(f"/?lang={lang}", data=payload)
+    if 300 <= response.status_code < 400:
+        response = client.get(response.headers["Location"])
+    return response
+
+
+@pytest.fixture(scope="session")
+def english_payload():
+    return _baseline_answers_with("en")
+
 
+def test_batch_scoring_matches_single_scoring():
+    rows = [[(question.id * seed) % 7 - 3 for question in QUESTIONS] for seed in range(1, 6)]
+    expected = [compute_axis_scores(row) for row in rows]
+    assert compute_axis_scores_batch(rows) == expected
 
-def test_result_page_is_english(client):
-    answers = _baseline_answers()
-    payload = {"lang": "en", **answers}
-    response = client.post("/?lang=en", data=payload, follow_redirects=True)
+
+def test_batch_scoring_does_not_wrap_large_answers():
+    rows = [[-128 if question.id % 2 else 300 for question in QUESTIONS]]
+    assert compute_axis_scores_batch(rows) == [compute_axis_scores(rows[0])]
+
+
+def test_batch_scoring_rejects_flat_answer_list():
+    flat = [1] * (len(QUESTIONS) * 2)
+    with pytest.raises(ValueError):
+        compute_axis_scores_batch(flat)
+
+
+def test_result_page_is_english(client, english_payload):
+    response = _submit_quiz(client, "en", english_payload)
     assert response.status_code == 200
     body = response.get_data(as_text=True)
 
@@ -28,10 +66,28 @@ def test_result_page_is_english(client):
     assert "答题" not in body
 
 
-def test_pdf_export_endpoint(client):
-    answers = _baseline_answers()
-    answers["lang"] = "en"
-    response = client.post("/export/pdf", data=answers)
+def _language_links_from(body):
+    return re.findall(r'href="([^"]*lang=[^"]*)"', body)
+
+
+def test_language_switcher_respects_script_root(client):
+    client.post("/?lang=en", data={})
+    response = client.post("/?lang=en", data={}, base_url="http://localhost/sub")
+    links = _language_links_from(response.get_data(as_text=True))
+    assert links
+    assert all(link.startswith("/sub/") for link in links)
+
+
+def test_quiz_page_respects_script_root(client):
+    root = client.get("/?lang=en").get_data(as_text=True)
+    prefixed = client.get("/?lang=en", base_url="http://localhost/sub").get_data(as_text=True)
+    assert 'href="/static/' in root
+    assert 'href="/sub/static/' in prefixed
+    assert all(link.startswith("/sub/") for link in _language_links_from(prefixed))
+
+
+def test_pdf_export_endpoint(client, english_payload):
+    response = client.post("/export/pdf", data=english_payload)
     assert response.status_code == 200
     assert response.headers["Content-Type"] == "application/pdf"
     content_disposition = response.headers.get("Content-Disposition", "")
@@ -40,7 +96,32 @@ def test_pdf_export_endpoint(client):
     assert len(response.data) > 1024
 
 
-def test_pdf_export_includes_persona_sections(client, monkeypatch):
+def test_pdf_fonts_are_not_shared_between_documents():
+    first, second = _get_pdf_fonts(), _get_pdf_fonts()
+    if not first:
+        pytest.skip("CJK fonts are not available")
+    for key, font in first.items():
+        assert font.ttfont is not second[key].ttfont
+
+
+def test_pdf_export_falls_back_to_add_font(client, monkeypatch):
+    monkeypatch.setattr("app._pdf_font_prototype", False)
+    response = client.post("/export/pdf", data=_baseline_answers_with("zh"))
+    assert response.status_code == 200
+    assert response.data.startswith(b"%PDF")
+
+
+def test_pdf_export_is_stable_across_languages(client):
+    sizes = []
+    for lang in ("zh", "en", "zh"):
+        response = client.post("/export/pdf", data=_baseline_answers_with(lang))
+        assert response.status_code == 200
+        assert response.data.startswith(b"%PDF")
+        sizes.append(len(response.data))
+    assert sizes[0] == sizes[2]
+
+
+def test_pdf_export_includes_persona_sections(client, english_payload, monkeypatch):
     captured = {}
 
     def fake_generate_pdf_report(**kwargs):
@@ -53,24 +134,23 @@ def test_pdf_export_includes_persona_sections(client, monkeypatch):
 
     monkeypatch.setattr("app.generate_pdf_report", fake_generate_pdf_report)
 
-    answers = _baseline_answers()
-    answers["lang"] = "en"
-    response = client.post("/export/pdf", data=answers)
+    response = client.post("/export/pdf", data=english_payload)
     assert response.status_code == 200
     assert captured["sections"]
     assert captured["tagline"] is not None
 
 
-def test_persona_content_matches_language(client):
-    answers = _baseline_answers()
-
-    en_response = client.post("/?lang=en", data={"lang": "en", **answers}, follow_redirects=True)
-    assert en_response.status_code == 200
-    en_body = en_response.get_data(as_text=True)
-    assert "You are a fast-thinking problem solver" in en_body
-    assert "你是那种爱挑战" not in en_body
-
-    zh_response = client.post("/?lang=zh", data={"lang": "zh", **answers}, follow_redirects=True)
-    assert zh_response.status_code == 200
-    zh_body = zh_response.get_data(as_text=True)
-    assert "你是那种爱挑战" in zh_body
+@pytest.mark.parametrize(
+    "lang,needle,absent",
+    [
+        ("en", "You are a fast-thinking problem solver", "你是那种爱挑战"),
+        ("zh", "你是那种爱挑战", None),
+    ],
+)
+def test_persona_content_matches_language(client, lang, needle, absent):
+    response = _submit_quiz(client, lang, _baseline_answers_with(lang))
+    assert response.status_code == 200
+    body = response.get_data(as_text=True)
+    assert needle in body
+    if absent:
+        assert absent not in body